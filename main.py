@@ -1,21 +1,18 @@
-from utils.file_handler import read_sales_data
-from utils.data_processor import (
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.file_handler import (
+    read_sales_file,
     parse_transactions,
-    validate_and_filter,
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    find_peak_sales_day,
-    low_performing_products
+    validate_and_filter
 )
+from utils.data_processor import analyze_sales
 from utils.api_handler import (
     fetch_all_products,
     create_product_mapping,
-    enrich_sales_data
+    enrich_sales_data,
+    save_enriched_data
 )
-from utils.report_generator import generate_sales_report
+from report_generator import generate_sales_report
 
 def main():
     """
@@ -34,8 +31,8 @@ def main():
     8. Perform all data analyses (call all functions from Part 2)
     9. Fetch products from API
     10. Enrich sales data with API info
-    11. Save enriched data to file
-    12. Generate comprehensive report
+    11. Save enriched data to file (in the background)
+    12. Generate comprehensive report (while the save runs)
     13. Print success message with file locations
     Error Handling:
     - Wrap entire process in try-except
@@ -49,7 +46,7 @@ def main():
 
         # 1. Read data
         print("\n[1/10] Reading sales data...")
-        raw_lines = read_sales_data("data/sales_data.txt")
+        raw_lines = read_sales_file("data/sales_data.txt")
         print(f"✓ Successfully read {len(raw_lines)} transactions")
 
         # 2. Parse and clean
@@ -60,7 +57,7 @@ def main():
         # 3. Show filter options
         print("\n[3/10] Filter Options Available:")
         regions = sorted(set(t["Region"] for t in transactions))
-        amounts = [t["Quantity"] * t["UnitPrice"] for t in transactions]
+        amounts = [t["Amount"] for t in transactions]
         print("Regions:", ", ".join(regions))
         print(f"Amount Range: ₹{int(min(amounts))} - ₹{int(max(amounts))}")
         apply_filter = input("\nDo you want to filter data? (y/n): ").lower()
@@ -83,13 +80,7 @@ def main():
 
         # 5. Analysis
         print("\n[5/10] Analyzing sales data...")
-        calculate_total_revenue(transactions)
-        region_wise_sales(transactions)
-        top_selling_products(transactions)
-        customer_analysis(transactions)
-        daily_sales_trend(transactions)
-        find_peak_sales_day(transactions)
-        low_performing_products(transactions)
+        analysis = analyze_sales(transactions)
         print("✓ Analysis complete")
 
         # 6. API fetch
@@ -106,14 +97,20 @@ def main():
         print(f"✓ Enriched {enriched_count}/{len(enriched_transactions)} "
               f"transactions ({success_rate:.1f}%)")
 
-        # 8. Save already done in enrich_sales_data
-        print("\n[8/10] Saving enriched data...")
-        print("✓ Saved to: data/enriched_sales_data.txt")
+        # 8. Save enriched data; the write overlaps report generation
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            print("\n[8/10] Saving enriched data...")
+            save_future = executor.submit(save_enriched_data,
+                                          enriched_transactions)
+
+            # 9. Generate report
+            print("\n[9/10] Generating report...")
+            generate_sales_report(transactions, enriched_transactions,
+                                  analysis=analysis)
+            print("✓ Report saved to: output/sales_report.txt")
 
-        # 9. Generate report
-        print("\n[9/10] Generating report...")
-        generate_sales_report(transactions, enriched_transactions)
-        print("✓ Report saved to: output/sales_report.txt")
+            save_future.result()
+            print("✓ Saved to: data/enriched_sales_data.txt")
 
         # 10. Done
         print("\n[10/10] Process Complete!")
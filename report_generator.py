@@ -1,17 +1,14 @@
+import io
 from datetime import datetime
-from utils.data_processor import (
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    find_peak_sales_day,
-    low_performing_products
-)
-
-def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt'):
+from utils.data_processor import analyze_sales
+
+def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt',
+                          analysis=None):
     """
     Generates a comprehensive formatted text report
+    Parameters:
+    - analysis: precomputed analyze_sales() result (optional); computed
+      here in a single pass when omitted
     Report Must Include (in this order):
     1. HEADER
        - Report title
@@ -43,108 +40,115 @@ def generate_sales_report(transactions, enriched_transactions, output_file='outp
        - Success rate percentage
        - List of products that couldn't be enriched
     """
-    with open(output_file, "w", encoding="utf-8") as file:
+    # Build the report in memory and write it to disk in one go
+    report = io.StringIO()
+
+    if analysis is None:
+        analysis = analyze_sales(transactions)
+
+    # 1. HEADER
+    report.write("=" * 50 + "\n")
+    report.write("        SALES ANALYTICS REPORT\n")
+    report.write(f"      Generated: {datetime.now()}\n")
+    report.write(f"      Records Processed: {len(transactions)}\n")
+    report.write("=" * 50 + "\n\n")
+
+    # 2. OVERALL SUMMARY
+    total_revenue = analysis["total_revenue"]
+    avg_order = total_revenue / len(transactions)
+    dates = [t["Date"] for t in transactions]
+    report.write("OVERALL SUMMARY\n")
+    report.write("-" * 50 + "\n")
+    report.write(f"Total Revenue:        ₹{total_revenue:,.2f}\n")
+    report.write(f"Total Transactions:   {len(transactions)}\n")
+    report.write(f"Average Order Value:  ₹{avg_order:,.2f}\n")
+    report.write(f"Date Range:           {min(dates)} to {max(dates)}\n\n")
+
+    # 3. REGION-WISE PERFORMANCE
+    region_data = analysis["region_sales"]
+    report.write("REGION-WISE PERFORMANCE\n")
+    report.write("-" * 50 + "\n")
+    report.write("Region    Sales        % of Total  Transactions\n")
+
+    for region, data in region_data.items():
+        report.write(
+            f"{region:<10} ₹{data['total_sales']:,.2f}   "
+            f"{data['percentage']:>6}%      {data['transaction_count']}\n"
+        )
+    report.write("\n")
+
+    # 4. TOP 5 PRODUCTS
+    top_products = analysis["top_products"]
+    report.write("TOP 5 PRODUCTS\n")
+    report.write("-" * 50 + "\n")
+    report.write("Rank  Product Name        Quantity  Revenue\n")
+    rank = 1
+    for p in top_products:
+        report.write(
+            f"{rank:<5} {p[0]:<18} {p[1]:<8} ₹{p[2]:,.2f}\n"
+        )
+        rank += 1
+    report.write("\n")
 
-        # 1. HEADER
-        file.write("=" * 50 + "\n")
-        file.write("        SALES ANALYTICS REPORT\n")
-        file.write(f"      Generated: {datetime.now()}\n")
-        file.write(f"      Records Processed: {len(transactions)}\n")
-        file.write("=" * 50 + "\n\n")
-
-        # 2. OVERALL SUMMARY
-        total_revenue = calculate_total_revenue(transactions)
-        avg_order = total_revenue / len(transactions)
-        dates = [t["Date"] for t in transactions]
-        file.write("OVERALL SUMMARY\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Total Revenue:        ₹{total_revenue:,.2f}\n")
-        file.write(f"Total Transactions:   {len(transactions)}\n")
-        file.write(f"Average Order Value:  ₹{avg_order:,.2f}\n")
-        file.write(f"Date Range:           {min(dates)} to {max(dates)}\n\n")
-
-        # 3. REGION-WISE PERFORMANCE
-        region_data = region_wise_sales(transactions)
-        file.write("REGION-WISE PERFORMANCE\n")
-        file.write("-" * 50 + "\n")
-        file.write("Region    Sales        % of Total  Transactions\n")
-
-        for region, data in region_data.items():
-            file.write(
-                f"{region:<10} ₹{data['total_sales']:,.2f}   "
-                f"{data['percentage']:>6}%      {data['transaction_count']}\n"
-            )
-        file.write("\n")
-
-        # 4. TOP 5 PRODUCTS
-        top_products = top_selling_products(transactions, 5)
-        file.write("TOP 5 PRODUCTS\n")
-        file.write("-" * 50 + "\n")
-        file.write("Rank  Product Name        Quantity  Revenue\n")
-        rank = 1
-        for p in top_products:
-            file.write(
-                f"{rank:<5} {p[0]:<18} {p[1]:<8} ₹{p[2]:,.2f}\n"
-            )
-            rank += 1
-        file.write("\n")
-
-        # 5. TOP 5 CUSTOMERS
-        customers = customer_analysis(transactions)
-        top_customers = list(customers.items())[:5]
-        file.write("TOP 5 CUSTOMERS\n")
-        file.write("-" * 50 + "\n")
-        file.write("Rank  Customer  Total Spent  Orders\n")
-        rank = 1
-        for cid, data in top_customers:
-            file.write(
-                f"{rank:<5} {cid:<9} ₹{data['total_spent']:,.2f}  "
-                f"{data['purchase_count']}\n"
-            )
-            rank += 1
-        file.write("\n")
-
-        # 6. DAILY SALES TREND
-        daily_data = daily_sales_trend(transactions)
-        file.write("DAILY SALES TREND\n")
-        file.write("-" * 50 + "\n")
-        file.write("Date         Revenue        Transactions  Customers\n")
-
-        for date, data in daily_data.items():
-            file.write(
-                f"{date}  ₹{data['revenue']:,.2f}    "
-                f"{data['transaction_count']}           "
-                f"{data['unique_customers']}\n"
-            )
-        file.write("\n")
-
-        # 7. PRODUCT PERFORMANCE ANALYSIS
-        peak_day = find_peak_sales_day(transactions)
-        low_products = low_performing_products(transactions)
-        file.write("PRODUCT PERFORMANCE ANALYSIS\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Best Selling Day: {peak_day[0]} "
-                   f"(₹{peak_day[1]:,.2f}, {peak_day[2]} transactions)\n\n")
-
-        file.write("Low Performing Products:\n")
-        if low_products:
-            for p in low_products:
-                file.write(f"- {p[0]} (Qty: {p[1]}, Revenue: ₹{p[2]:,.2f})\n")
-        else:
-            file.write("None\n")
-        file.write("\n")
-
-        # 8. API ENRICHMENT SUMMARY
-        enriched = [t for t in enriched_transactions if t["API_Match"]]
-        not_enriched = [t for t in enriched_transactions if not t["API_Match"]]
-        success_rate = (len(enriched) / len(enriched_transactions)) * 100
-        file.write("API ENRICHMENT SUMMARY\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Total Records Enriched: {len(enriched)}\n")
-        file.write(f"Success Rate: {success_rate:.2f}%\n")
-        file.write("Products Not Enriched:\n")
-
-        for t in not_enriched:
-            file.write(f"- {t['ProductID']} ({t['ProductName']})\n")
+    # 5. TOP 5 CUSTOMERS
+    customers = analysis["customers"]
+    top_customers = list(customers.items())[:5]
+    report.write("TOP 5 CUSTOMERS\n")
+    report.write("-" * 50 + "\n")
+    report.write("Rank  Customer  Total Spent  Orders\n")
+    rank = 1
+    for cid, data in top_customers:
+        report.write(
+            f"{rank:<5} {cid:<9} ₹{data['total_spent']:,.2f}  "
+            f"{data['purchase_count']}\n"
+        )
+        rank += 1
+    report.write("\n")
+
+    # 6. DAILY SALES TREND
+    daily_data = analysis["daily_trend"]
+    report.write("DAILY SALES TREND\n")
+    report.write("-" * 50 + "\n")
+    report.write("Date         Revenue        Transactions  Customers\n")
+
+    for date, data in daily_data.items():
+        report.write(
+            f"{date}  ₹{data['revenue']:,.2f}    "
+            f"{data['transaction_count']}           "
+            f"{data['unique_customers']}\n"
+        )
+    report.write("\n")
+
+    # 7. PRODUCT PERFORMANCE ANALYSIS
+    peak_day = analysis["peak_day"]
+    low_products = analysis["low_products"]
+    report.write("PRODUCT PERFORMANCE ANALYSIS\n")
+    report.write("-" * 50 + "\n")
+    report.write(f"Best Selling Day: {peak_day[0]} "
+                 f"(₹{peak_day[1]:,.2f}, {peak_day[2]} transactions)\n\n")
+
+    report.write("Low Performing Products:\n")
+    if low_products:
+        for p in low_products:
+            report.write(f"- {p[0]} (Qty: {p[1]}, Revenue: ₹{p[2]:,.2f})\n")
+    else:
+        report.write("None\n")
+    report.write("\n")
+
+    # 8. API ENRICHMENT SUMMARY
+    enriched = [t for t in enriched_transactions if t["API_Match"]]
+    not_enriched = [t for t in enriched_transactions if not t["API_Match"]]
+    success_rate = (len(enriched) / len(enriched_transactions)) * 100
+    report.write("API ENRICHMENT SUMMARY\n")
+    report.write("-" * 50 + "\n")
+    report.write(f"Total Records Enriched: {len(enriched)}\n")
+    report.write(f"Success Rate: {success_rate:.2f}%\n")
+    report.write("Products Not Enriched:\n")
+
+    for t in not_enriched:
+        report.write(f"- {t['ProductID']} ({t['ProductName']})\n")
+
+    with open(output_file, "w", encoding="utf-8") as file:
+        file.write(report.getvalue())
 
     print("Sales report generated:", output_file)
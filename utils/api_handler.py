@@ -1,5 +1,26 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
+API_URL = "https://dummyjson.com/products"
+PAGE_SIZE = 100
+CACHE_FILE = "data/_api_cache.json"
+CACHE_TTL = 60 * 60  # seconds
+PRODUCT_FIELDS = ("id", "title", "category", "brand", "price", "rating")
+
+
+def fetch_product_page(skip, limit=PAGE_SIZE):
+    """
+    Fetches one page of products from DummyJSON API
+    Returns: decoded JSON response ({'products': [...], 'total': ...})
+    """
+    response = requests.get(API_URL, params={"skip": skip, "limit": limit})
+    return response.json()
+
+
 def fetch_all_products():
     """
     Fetches all products from DummyJSON API
@@ -16,16 +37,41 @@ def fetch_all_products():
         },
         ...
     ]
+
+    The first page reports the catalogue total; any remaining pages are
+    requested concurrently so the extra round trips overlap. A page that
+    fails is skipped and the products from the other pages are kept.
+
+    Results are cached in CACHE_FILE and reused for CACHE_TTL seconds.
     """
-    url = "https://dummyjson.com/products?limit=100"
+    cached = load_cached_products()
+    if cached:
+        print("API cache hit. Products loaded:", len(cached))
+        return cached
 
     try:
-        response = requests.get(url)
-        data = response.json()
+        data = fetch_product_page(0)
+        raw_products = list(data["products"])
+
+        # Step by the page size the server actually returned, which may be
+        # capped below the PAGE_SIZE that was requested
+        page_size = len(raw_products)
+        remaining = range(page_size, data.get("total", 0), page_size or 1)
+
+        if raw_products and remaining:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                futures = [executor.submit(fetch_product_page, skip, page_size)
+                           for skip in remaining]
+
+                for skip, future in zip(remaining, futures):
+                    try:
+                        raw_products.extend(future.result()["products"])
+                    except Exception as e:
+                        print(f"API page fetch failed (skip={skip}):", e)
 
         products = []
 
-        for p in data["products"]:
+        for p in raw_products:
             products.append({
                 "id": p["id"],
                 "title": p["title"],
@@ -36,6 +82,10 @@ def fetch_all_products():
             })
 
         print("API fetch successful. Products fetched:", len(products))
+
+        # Only cache a complete catalogue so a partial fetch is retried
+        if len(products) == data.get("total", len(products)):
+            save_cached_products(products)
         return products
 
     except Exception as e:
@@ -43,6 +93,43 @@ def fetch_all_products():
         return []
 
 
+def load_cached_products(cache_file=CACHE_FILE, ttl=CACHE_TTL):
+    """
+    Loads products cached by a previous run
+    Returns: list of product dictionaries, or None if missing/stale/unreadable
+    or not shaped like fetch_all_products() output
+    """
+    try:
+        if time.time() - os.path.getmtime(cache_file) >= ttl:
+            return None
+        with open(cache_file, "r", encoding="utf-8") as file:
+            products = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(products, list):
+        return None
+    for p in products:
+        if not isinstance(p, dict) or any(f not in p for f in PRODUCT_FIELDS):
+            return None
+
+    return products
+
+
+def save_cached_products(products, cache_file=CACHE_FILE):
+    """
+    Saves fetched products so later runs can skip the HTTP round trip
+    """
+    if not products:
+        return
+
+    try:
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(products, file)
+    except OSError as e:
+        print("API cache write failed:", e)
+
+
 def create_product_mapping(api_products):
     """
     Creates a mapping of product IDs to product info
@@ -74,33 +161,39 @@ def enrich_sales_data(transactions, product_mapping):
     - transactions: list of transaction dictionaries
     - product_mapping: dictionary from create_product_mapping()
     Returns: list of enriched transaction dictionaries
+    (the same list, with API fields added to each transaction in place)
+    Use save_enriched_data() to write the result to file.
     """
-    enriched = []
+    # ProductID -> API fields, so each distinct ID is parsed and looked up once
+    api_fields = {}
+
     for t in transactions:
         product_id = t["ProductID"]
 
-        try:
-            numeric_id = int(product_id.replace("P", ""))
-        except:
-            numeric_id = None
-
-        new_t = t.copy()
+        if product_id not in api_fields:
+            try:
+                numeric_id = int(product_id.replace("P", ""))
+            except ValueError:
+                numeric_id = None
 
-        if numeric_id in product_mapping:
-            new_t["API_Category"] = product_mapping[numeric_id]["category"]
-            new_t["API_Brand"] = product_mapping[numeric_id]["brand"]
-            new_t["API_Rating"] = product_mapping[numeric_id]["rating"]
-            new_t["API_Match"] = True
-        else:
-            new_t["API_Category"] = None
-            new_t["API_Brand"] = None
-            new_t["API_Rating"] = None
-            new_t["API_Match"] = False
+            if numeric_id in product_mapping:
+                api_fields[product_id] = {
+                    "API_Category": product_mapping[numeric_id]["category"],
+                    "API_Brand": product_mapping[numeric_id]["brand"],
+                    "API_Rating": product_mapping[numeric_id]["rating"],
+                    "API_Match": True
+                }
+            else:
+                api_fields[product_id] = {
+                    "API_Category": None,
+                    "API_Brand": None,
+                    "API_Rating": None,
+                    "API_Match": False
+                }
 
-        enriched.append(new_t)
+        t.update(api_fields[product_id])
 
-    save_enriched_data(enriched)
-    return enriched
+    return transactions
 
 
 def save_enriched_data(enriched_transactions, filename='data/enriched_sales_data.txt'):
@@ -116,30 +209,11 @@ def save_enriched_data(enriched_transactions, filename='data/enriched_sales_data
         "API_Category", "API_Brand", "API_Rating", "API_Match"
     ]
 
+    # Assemble every row first and hand the file a single write
+    lines = ["|".join(header)]
+    for t in enriched_transactions:
+        lines.append("|".join([str(t.get(field)) for field in header]))
+
     with open(filename, "w", encoding="utf-8") as file:
-        file.write("|".join(header) + "\n")
-
-        for t in enriched_transactions:
-            row = [
-                str(t.get("TransactionID")),
-                str(t.get("Date")),
-                str(t.get("ProductID")),
-                str(t.get("ProductName")),
-                str(t.get("Quantity")),
-                str(t.get("UnitPrice")),
-                str(t.get("CustomerID")),
-                str(t.get("Region")),
-                str(t.get("API_Category")),
-                str(t.get("API_Brand")),
-                str(t.get("API_Rating")),
-                str(t.get("API_Match"))
-            ]
-
-            file.write("|".join(row) + "\n")
-
-    print("Enriched data saved to:", filename)
-
-api_products = fetch_all_products()
-product_mapping = create_product_mapping(api_products)
-enriched_transactions = enrich_sales_data(transactions, product_mapping)
+        file.write("\n".join(lines) + "\n")
 
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 def calculate_total_revenue(transactions):
     """
     Calculates total revenue from all transactions
@@ -7,15 +9,16 @@ def calculate_total_revenue(transactions):
     Expected Output: Single number representing sum of (Quantity * UnitPrice)
     Example: 1545000.50
     """
-    total = 0
-    for t in transactions:
-        total += t["Quantity"] * t["UnitPrice"]
-    return total
+    return sum(t["Amount"] for t in transactions)
 
-def region_wise_sales(transactions):
+def region_wise_sales(transactions, total_sales=None):
     """
     Analyzes sales by region
 
+    Parameters:
+    - transactions: list of transaction dictionaries
+    - total_sales: precomputed calculate_total_revenue() result (optional)
+
     Returns: dictionary with region statistics
 
     Expected Output Format:
@@ -35,34 +38,55 @@ def region_wise_sales(transactions):
     - Calculate percentage of total sales
     - Sort by total_sales in descending order
     """
-    region_data = {}
-    total_sales = calculate_total_revenue(transactions)
+    if total_sales is None:
+        total_sales = calculate_total_revenue(transactions)
+
+    # Flat per-region accumulators keep the hot loop to one lookup each
+    sales = defaultdict(int)
+    counts = defaultdict(int)
 
     for t in transactions:
         region = t["Region"]
-        amount = t["Quantity"] * t["UnitPrice"]
+        sales[region] += t["Amount"]
+        counts[region] += 1
 
-        if region not in region_data:
-            region_data[region] = {
-                "total_sales": 0,
-                "transaction_count": 0
-            }
+    return _region_stats(sales, counts, total_sales)
+
+def _region_stats(sales, counts, total_sales):
+    """
+    Builds region_wise_sales() output from per-region sales and counts
+    """
+    # Sort the region keys on their flat totals, then build the output in order
+    region_data = {}
+    for region in sorted(sales, key=sales.__getitem__, reverse=True):
+        region_data[region] = {
+            "total_sales": sales[region],
+            "transaction_count": counts[region],
+            "percentage": round((sales[region] / total_sales) * 100, 2)
+        }
 
-        region_data[region]["total_sales"] += amount
-        region_data[region]["transaction_count"] += 1
+    return region_data
 
-    for region in region_data:
-        region_data[region]["percentage"] = round(
-            (region_data[region]["total_sales"] / total_sales) * 100, 2
-        )
+def _new_product_entry():
+    """
+    Returns an empty per-product accumulator
+    """
+    return {"qty": 0, "revenue": 0}
 
-    region_data = dict(
-        sorted(region_data.items(),
-               key=lambda x: x[1]["total_sales"],
-               reverse=True)
-    )
+def _product_totals(transactions):
+    """
+    Aggregates quantity and revenue per product in a single pass
 
-    return region_data
+    Returns: dictionary {ProductName: {'qty': int, 'revenue': float}}
+    """
+    product_data = defaultdict(_new_product_entry)
+
+    for t in transactions:
+        data = product_data[t["ProductName"]]
+        data["qty"] += t["Quantity"]
+        data["revenue"] += t["Amount"]
+
+    return product_data
 
 def top_selling_products(transactions, n=5):
     """
@@ -84,19 +108,12 @@ def top_selling_products(transactions, n=5):
     - Sort by TotalQuantity descending
     - Return top n products
     """
-    product_data = {}
-
-    for t in transactions:
-        name = t["ProductName"]
-        qty = t["Quantity"]
-        revenue = qty * t["UnitPrice"]
-
-        if name not in product_data:
-            product_data[name] = {"qty": 0, "revenue": 0}
-
-        product_data[name]["qty"] += qty
-        product_data[name]["revenue"] += revenue
+    return _top_products(_product_totals(transactions), n)
 
+def _top_products(product_data, n):
+    """
+    Builds top_selling_products() output from _product_totals() data
+    """
     result = []
     for name in product_data:
         data = product_data[name]
@@ -131,38 +148,47 @@ def customer_analysis(transactions):
     - List unique products bought
     - Sort by total_spent descending
     """
-    customer_data = {}
+    customer_data = defaultdict(_new_customer_entry)
 
     for t in transactions:
-        cid = t["CustomerID"]
-        amount = t["Quantity"] * t["UnitPrice"]
-        product = t["ProductName"]
-
-        if cid not in customer_data:
-            customer_data[cid] = {
-                "total_spent": 0,
-                "purchase_count": 0,
-                "products_bought": []
-            }
+        data = customer_data[t["CustomerID"]]
+        data["total_spent"] += t["Amount"]
+        data["purchase_count"] += 1
+        data["products_bought"][t["ProductName"]] = None
 
-        customer_data[cid]["total_spent"] += amount
-        customer_data[cid]["purchase_count"] += 1
+    return _customer_stats(customer_data)
 
-        if product not in customer_data[cid]["products_bought"]:
-            customer_data[cid]["products_bought"].append(product)
+def _new_customer_entry():
+    """
+    Returns an empty per-customer accumulator
+    """
+    return {
+        "total_spent": 0,
+        "purchase_count": 0,
+        # dict keys act as an insertion-ordered set
+        "products_bought": {}
+    }
 
+def _customer_stats(customer_data):
+    """
+    Builds customer_analysis() output from per-customer accumulators
+    """
+    totals = {}
     for cid in customer_data:
+        customer_data[cid]["products_bought"] = list(
+            customer_data[cid]["products_bought"]
+        )
         total = customer_data[cid]["total_spent"]
         count = customer_data[cid]["purchase_count"]
         customer_data[cid]["avg_order_value"] = round(total / count, 2)
+        totals[cid] = total
 
-    customer_data = dict(
-        sorted(customer_data.items(),
-               key=lambda x: x[1]["total_spent"],
-               reverse=True)
-    )
+    # Sort on the flat totals rather than digging into each entry per compare
+    result = {}
+    for cid in sorted(totals, key=totals.__getitem__, reverse=True):
+        result[cid] = customer_data[cid]
 
-    return customer_data
+    return result
 
 def daily_sales_trend(transactions):
     """
@@ -188,26 +214,26 @@ def daily_sales_trend(transactions):
     - Count unique customers per day
     - Sort chronologically
     """
-    daily_data = {}
+    daily_data = defaultdict(_new_daily_entry)
 
     for t in transactions:
-        date = t["Date"]
-        amount = t["Quantity"] * t["UnitPrice"]
-        customer = t["CustomerID"]
-
-        if date not in daily_data:
-            daily_data[date] = {
-                "revenue": 0,
-                "transaction_count": 0,
-                "customers": []
-            }
+        data = daily_data[t["Date"]]
+        data["revenue"] += t["Amount"]
+        data["transaction_count"] += 1
+        data["customers"].add(t["CustomerID"])
 
-        daily_data[date]["revenue"] += amount
-        daily_data[date]["transaction_count"] += 1
+    return _daily_stats(daily_data)
 
-        if customer not in daily_data[date]["customers"]:
-            daily_data[date]["customers"].append(customer)
+def _new_daily_entry():
+    """
+    Returns an empty per-date accumulator
+    """
+    return {"revenue": 0, "transaction_count": 0, "customers": set()}
 
+def _daily_stats(daily_data):
+    """
+    Builds daily_sales_trend() output from per-date accumulators
+    """
     result = {}
     for date in sorted(daily_data):
         result[date] = {
@@ -218,28 +244,29 @@ def daily_sales_trend(transactions):
 
     return result
 
-def find_peak_sales_day(transactions):
+def find_peak_sales_day(transactions, daily_data=None):
     """
     Identifies the date with highest revenue
 
+    Parameters:
+    - transactions: list of transaction dictionaries
+    - daily_data: precomputed daily_sales_trend() result (optional)
+
     Returns: tuple (date, revenue, transaction_count)
 
     Expected Output Format:
     ('2024-12-15', 185000.0, 12)
     """
-    daily_data = daily_sales_trend(transactions)
+    if daily_data is None:
+        daily_data = daily_sales_trend(transactions)
 
-    peak_date = ""
-    max_revenue = 0
-    count = 0
+    if not daily_data:
+        return "", 0, 0
 
-    for date in daily_data:
-        if daily_data[date]["revenue"] > max_revenue:
-            max_revenue = daily_data[date]["revenue"]
-            peak_date = date
-            count = daily_data[date]["transaction_count"]
+    peak_date = max(daily_data, key=lambda d: daily_data[d]["revenue"])
+    peak = daily_data[peak_date]
 
-    return peak_date, max_revenue, count
+    return peak_date, peak["revenue"], peak["transaction_count"]
 
 
 def low_performing_products(transactions, threshold=10):
@@ -260,19 +287,12 @@ def low_performing_products(transactions, threshold=10):
     - Include total quantity and revenue
     - Sort by TotalQuantity ascending
     """
-    product_data = {}
-
-    for t in transactions:
-        name = t["ProductName"]
-        qty = t["Quantity"]
-        revenue = qty * t["UnitPrice"]
-
-        if name not in product_data:
-            product_data[name] = {"qty": 0, "revenue": 0}
-
-        product_data[name]["qty"] += qty
-        product_data[name]["revenue"] += revenue
+    return _low_products(_product_totals(transactions), threshold)
 
+def _low_products(product_data, threshold):
+    """
+    Builds low_performing_products() output from _product_totals() data
+    """
     result = []
     for name in product_data:
         if product_data[name]["qty"] < threshold:
@@ -284,4 +304,63 @@ def low_performing_products(transactions, threshold=10):
 
     return result
 
+def analyze_sales(transactions, top_n=5, threshold=10):
+    """
+    Runs every sales analysis in a single pass over the transactions
+
+    Returns: dictionary with the result of each analysis
 
+    Expected Output Format:
+    {
+        'total_revenue': 1545000.5,        # calculate_total_revenue()
+        'region_sales': {...},             # region_wise_sales()
+        'top_products': [...],             # top_selling_products(top_n)
+        'customers': {...},                # customer_analysis()
+        'daily_trend': {...},              # daily_sales_trend()
+        'peak_day': ('2024-12-15', ...),   # find_peak_sales_day()
+        'low_products': [...]              # low_performing_products(threshold)
+    }
+    """
+    total_revenue = 0
+    region_sales = defaultdict(int)
+    region_counts = defaultdict(int)
+    product_data = defaultdict(_new_product_entry)
+    customer_data = defaultdict(_new_customer_entry)
+    daily_data = defaultdict(_new_daily_entry)
+
+    for t in transactions:
+        region = t["Region"]
+        name = t["ProductName"]
+        cid = t["CustomerID"]
+        amount = t["Amount"]
+
+        total_revenue += amount
+
+        region_sales[region] += amount
+        region_counts[region] += 1
+
+        product = product_data[name]
+        product["qty"] += t["Quantity"]
+        product["revenue"] += amount
+
+        customer = customer_data[cid]
+        customer["total_spent"] += amount
+        customer["purchase_count"] += 1
+        customer["products_bought"][name] = None
+
+        day = daily_data[t["Date"]]
+        day["revenue"] += amount
+        day["transaction_count"] += 1
+        day["customers"].add(cid)
+
+    daily_trend = _daily_stats(daily_data)
+
+    return {
+        "total_revenue": total_revenue,
+        "region_sales": _region_stats(region_sales, region_counts, total_revenue),
+        "top_products": _top_products(product_data, top_n),
+        "customers": _customer_stats(customer_data),
+        "daily_trend": daily_trend,
+        "peak_day": find_peak_sales_day(transactions, daily_trend),
+        "low_products": _low_products(product_data, threshold)
+    }
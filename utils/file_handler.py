@@ -1,3 +1,5 @@
+import sys
+
 def read_sales_file(file_path):
     """
     Reads sales data from file handling encoding issues
@@ -19,14 +21,17 @@ def read_sales_file(file_path):
 
     for enc in encodings:
         try:
-            with open(filename, "r", encoding=enc) as file:
-                lines = file.readlines()
-
-            # Remove header and empty lines
-            cleaned_lines = []
-            for line in lines[1:]:   # skip header
-                if line.strip():
-                    cleaned_lines.append(line.strip())
+            # Stream the file line by line instead of materializing
+            # readlines() and then a second cleaned copy of it
+            with open(file_path, "r", encoding=enc) as file:
+                next(file, None)   # skip header
+
+                # Remove empty lines
+                cleaned_lines = []
+                for line in file:
+                    line = line.strip()
+                    if line:
+                        cleaned_lines.append(line)
 
             return cleaned_lines
 
@@ -47,7 +52,7 @@ def parse_transactions(raw_lines):
 
     Returns: list of dictionaries with keys:
     ['TransactionID', 'Date', 'ProductID', 'ProductName',
-     'Quantity', 'UnitPrice', 'CustomerID', 'Region']
+     'Quantity', 'UnitPrice', 'CustomerID', 'Region', 'Amount']
 
     Expected Output Format:
     [
@@ -59,7 +64,8 @@ def parse_transactions(raw_lines):
             'Quantity': 2,           # int type
             'UnitPrice': 45000.0,    # float type
             'CustomerID': 'C001',
-            'Region': 'North'
+            'Region': 'North',
+            'Amount': 90000.0        # Quantity * UnitPrice
         },
         ...
     ]
@@ -91,15 +97,18 @@ def parse_transactions(raw_lines):
         except:
             continue
 
+        # Low-cardinality fields are interned so every row shares one
+        # string object per distinct value instead of holding its own copy
         transaction = {
             "TransactionID": tid,
-            "Date": date,
-            "ProductID": pid,
-            "ProductName": pname,
+            "Date": sys.intern(date),
+            "ProductID": sys.intern(pid),
+            "ProductName": sys.intern(pname),
             "Quantity": qty,
             "UnitPrice": price,
-            "CustomerID": cid,
-            "Region": region
+            "CustomerID": sys.intern(cid),
+            "Region": sys.intern(region),
+            "Amount": qty * price
         }
 
         transactions.append(transaction)
@@ -162,23 +171,23 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     print("Available regions:", regions)
 
     # Display transaction amount range
-    amounts = [t["Quantity"] * t["UnitPrice"] for t in transactions]
+    amounts = [t["Amount"] for t in transactions]
     print("Transaction amount range:", min(amounts), "-", max(amounts))
 
-    for t in transactions:
-        # Validation checks
+    # Reuse the amounts computed for display instead of recomputing per row
+    for t, amount in zip(transactions, amounts):
+        # Validation checks (ID prefixes compared by slice, which avoids
+        # a startswith() method call per field)
         if (
             t["Quantity"] <= 0 or
             t["UnitPrice"] <= 0 or
-            not t["TransactionID"].startswith("T") or
-            not t["ProductID"].startswith("P") or
-            not t["CustomerID"].startswith("C")
+            t["TransactionID"][:1] != "T" or
+            t["ProductID"][:1] != "P" or
+            t["CustomerID"][:1] != "C"
         ):
             invalid_count += 1
             continue
 
-        amount = t["Quantity"] * t["UnitPrice"]
-
         # Region filter
         if region and t["Region"] != region:
             summary["filtered_by_region"] += 1
@@ -202,13 +211,3 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     print("Records after filtering:", summary["final_count"])
 
     return valid_transactions, invalid_count, summary
-
-
-raw_lines = read_sales_data("data/sales_data.txt")
-transactions = parse_transactions(raw_lines)
-
-valid_data, invalid_count, summary = validate_and_filter(
-    transactions,
-    region="North",
-    min_amount=5000
-)